@@ -9,7 +9,7 @@ from typing import List
 
 import pytest
 
-from trestlebot.tasks.base_task import ModelFilter
+from trestlebot.tasks.base_task import ModelFilter, TaskBase
 
 
 @pytest.mark.parametrize(
@@ -26,6 +26,17 @@ from trestlebot.tasks.base_task import ModelFilter
         ],
         [[], [], "simplified_nist_catalog", True],
         [[], ["*"], "simplified_nist_catalog", False],
+        [["*_profile", "*_catalog"], ["*"], "simplified_nist_catalog", True],
+        [[], ["*_profile", "simplified*"], "simplified_nist_catalog", False],
+        [[], ["simplified_nist_[cp]*"], "simplified_nist_catalog", False],
+        [[], ["simplified_nist"], "simplified_nist_catalog", True],
+        [[], ["model.v1"], "model_v1", True],
+        [[], ["*"], ".keep", True],
+        [["model_a", "simplified*"], ["model_a"], "model_a", True],
+        [["model_a", "simplified*"], ["model_*"], "model_b", False],
+        [["model_a"], ["*"], "model_a", True],
+        [["model_a"], ["*"], "model_b", False],
+        [["model_*"], ["other", "*"], "model_b", True],
     ],
 )
 def test_is_skipped(
@@ -35,3 +46,53 @@ def test_is_skipped(
     model_path = pathlib.Path(model_name)
     model_filter = ModelFilter(skip_list, include_list)
     assert model_filter.is_skipped(model_path) == expected
+    assert model_filter.filter_names([model_name]) == ([] if expected else [model_name])
+
+
+class _NoopTask(TaskBase):
+    """Minimal task for testing base task behavior."""
+
+    def execute(self) -> int:
+        return 0
+
+
+def test_iterate_models(tmp_path: pathlib.Path) -> None:
+    """Test iterating models with hidden files and a filter."""
+    tmp_path.joinpath("model_a").mkdir()
+    tmp_path.joinpath("model_b").mkdir()
+    tmp_path.joinpath(".hidden_dir").mkdir()
+    tmp_path.joinpath(".keep").touch()
+    tmp_path.joinpath(".hidden_file").touch()
+
+    task = _NoopTask(str(tmp_path), None)
+    names = sorted(model.name for model in task.iterate_models(tmp_path))
+    assert names == [".hidden_dir", "model_a", "model_b"]
+
+    task = _NoopTask(str(tmp_path), ModelFilter(["model_b"], ["*"]))
+    models = list(task.iterate_models(tmp_path))
+    assert sorted(model.name for model in models) == [".hidden_dir", "model_a"]
+    assert all(model.parent == tmp_path for model in models)
+
+    models_from_str = list(task.iterate_models(str(tmp_path)))
+    assert sorted(models_from_str) == sorted(models)
+
+
+def test_model_filter_copies_patterns() -> None:
+    """Test that the filter does not share or modify the caller's pattern lists."""
+    skip_list: List[str] = ["model_b"]
+    include_list: List[str] = ["model_*"]
+    model_filter = ModelFilter(skip_list, include_list)
+    assert skip_list == ["model_b"]
+
+    include_list.append("other")
+    assert model_filter.is_skipped(pathlib.Path("other"))
+
+    ModelFilter(skip_list, include_list)
+    assert skip_list == ["model_b"]
+
+
+def test_filter_names() -> None:
+    """Test filtering a batch of names keeps the original order."""
+    model_filter = ModelFilter(["*_profile", "model_b"], ["model_*", "*_profile"])
+    names = ["model_c", "simplified_nist_profile", "model_b", "other", "model_a"]
+    assert model_filter.filter_names(names) == ["model_c", "model_a"]
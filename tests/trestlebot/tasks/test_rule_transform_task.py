@@ -5,6 +5,8 @@
 """Test for Trestle Bot rule transform task."""
 
 import pathlib
+from typing import Any
+from unittest.mock import patch
 
 import pytest
 import trestle.oscal.component as osc_comp
@@ -73,6 +75,93 @@ def test_rule_transform_task(tmp_trestle_dir: str) -> None:
     assert "My check description" in prop_values
 
 
+def test_rule_transform_task_multiple_compdefs(tmp_trestle_dir: str) -> None:
+    """Test rule transform task with multiple component definitions."""
+    trestle_root = pathlib.Path(tmp_trestle_dir)
+    compdef_names = [f"{test_comp}_{i}" for i in range(4)]
+    for compdef_name in compdef_names:
+        setup_rules_view(trestle_root, compdef_name, test_rules_dir)
+    transformer = ToRulesYAMLTransformer()
+    rule_transform_task = RuleTransformTask(
+        tmp_trestle_dir, test_rules_dir, transformer
+    )
+    return_code = rule_transform_task.execute()
+    assert return_code == 0
+
+    for compdef_name in compdef_names:
+        compdef, _ = ModelUtils.load_model_for_class(
+            trestle_root,
+            compdef_name,
+            osc_comp.ComponentDefinition,
+            FileContentType.JSON,
+        )
+        assert compdef is not None
+        assert compdef.metadata.title == f"Component definition for {compdef_name}"
+        assert compdef.components is not None
+        assert len(compdef.components) == 2
+
+
+def test_rule_transform_task_reuses_rules(tmp_trestle_dir: str) -> None:
+    """Test that rules with identical content are only transformed once."""
+    trestle_root = pathlib.Path(tmp_trestle_dir)
+    setup_rules_view(trestle_root, test_comp, test_rules_dir)
+    transformer = ToRulesYAMLTransformer()
+    rule_transform_task = RuleTransformTask(
+        tmp_trestle_dir, test_rules_dir, transformer
+    )
+
+    with patch.object(
+        transformer, "transform", wraps=transformer.transform
+    ) as mock_transform:
+        assert rule_transform_task.execute() == 0
+        assert mock_transform.call_count == 3
+
+        assert rule_transform_task.execute() == 0
+        assert mock_transform.call_count == 3
+
+
+def test_rule_transform_task_bounds_rule_cache(
+    tmp_trestle_dir: str, monkeypatch: Any
+) -> None:
+    """Test that the least recently used rules are dropped from a full cache."""
+    monkeypatch.setattr("trestlebot.tasks.rule_transform_task.RULE_CACHE_SIZE", 2)
+    trestle_root = pathlib.Path(tmp_trestle_dir)
+    setup_rules_view(trestle_root, test_comp, test_rules_dir)
+    transformer = ToRulesYAMLTransformer()
+    rule_transform_task = RuleTransformTask(
+        tmp_trestle_dir, test_rules_dir, transformer
+    )
+
+    with patch.object(
+        transformer, "transform", wraps=transformer.transform
+    ) as mock_transform:
+        assert rule_transform_task.execute() == 0
+        assert mock_transform.call_count == 3
+        assert len(rule_transform_task._rule_cache) == 2
+
+        # Each rule was dropped before it was read again
+        assert rule_transform_task.execute() == 0
+        assert mock_transform.call_count == 6
+        assert len(rule_transform_task._rule_cache) == 2
+
+
+def test_rule_transform_task_with_percent_in_name(tmp_trestle_dir: str) -> None:
+    """Test rule transform task with a component definition name containing %."""
+    trestle_root = pathlib.Path(tmp_trestle_dir)
+    compdef_name = f"{test_comp}_100%"
+    setup_rules_view(trestle_root, compdef_name, test_rules_dir)
+    transformer = ToRulesYAMLTransformer()
+    rule_transform_task = RuleTransformTask(
+        tmp_trestle_dir, test_rules_dir, transformer
+    )
+    assert rule_transform_task.execute() == 0
+
+    compdef, _ = ModelUtils.load_model_for_class(
+        trestle_root, compdef_name, osc_comp.ComponentDefinition, FileContentType.JSON
+    )
+    assert compdef.metadata.title == f"Component definition for {compdef_name}"
+
+
 def test_rule_transform_task_with_no_rules(tmp_trestle_dir: str) -> None:
     """Test rule transform task with no rules."""
     trestle_root = pathlib.Path(tmp_trestle_dir)
@@ -119,3 +208,51 @@ def test_rule_transform_task_with_skip(tmp_trestle_dir: str) -> None:
         ModelUtils.load_model_for_class(
             trestle_root, test_comp, osc_comp.ComponentDefinition, FileContentType.JSON
         )
+
+
+def test_rule_transform_task_with_skipped_rule(tmp_trestle_dir: str) -> None:
+    """Test rule transform task with skipped and hidden rule files."""
+    trestle_root = pathlib.Path(tmp_trestle_dir)
+    setup_rules_view(trestle_root, test_comp, test_rules_dir)
+    comp_dir = trestle_root.joinpath(test_rules_dir, test_comp, test_comp)
+    comp_dir.joinpath(".hidden_rule.yaml").write_text("invalid")
+    transformer = ToRulesYAMLTransformer()
+
+    model_filter = ModelFilter(["test_complete_rule_no_params.yaml"], ["*"])
+    rule_transform_task = RuleTransformTask(
+        tmp_trestle_dir, test_rules_dir, transformer, model_filter=model_filter
+    )
+    return_code = rule_transform_task.execute()
+    assert return_code == 0
+
+    orig_comp, _ = ModelUtils.load_model_for_class(
+        trestle_root, test_comp, osc_comp.ComponentDefinition, FileContentType.JSON
+    )
+    assert orig_comp.components is not None
+    assert len(orig_comp.components) == 1
+    assert orig_comp.components[0].title == "Component 1"
+
+
+def test_rule_transform_task_with_symlinked_component(
+    tmp_trestle_dir: str, tmp_path: pathlib.Path
+) -> None:
+    """Test rule transform task with a symlinked component directory."""
+    trestle_root = pathlib.Path(tmp_trestle_dir)
+    setup_rules_view(trestle_root, test_comp, test_rules_dir)
+    compdef_dir = trestle_root.joinpath(test_rules_dir, test_comp)
+    comp_dir = compdef_dir.joinpath(test_comp)
+    linked_comp_dir = tmp_path.joinpath("linked_comp")
+    comp_dir.rename(linked_comp_dir)
+    comp_dir.symlink_to(linked_comp_dir, target_is_directory=True)
+
+    transformer = ToRulesYAMLTransformer()
+    rule_transform_task = RuleTransformTask(
+        tmp_trestle_dir, test_rules_dir, transformer
+    )
+    assert rule_transform_task.execute() == 0
+
+    orig_comp, _ = ModelUtils.load_model_for_class(
+        trestle_root, test_comp, osc_comp.ComponentDefinition, FileContentType.JSON
+    )
+    assert orig_comp.components is not None
+    assert len(orig_comp.components) == 2
@@ -0,0 +1,116 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2024 Red Hat, Inc.
+
+
+"""Test for the CaC content sync task."""
+
+import pathlib
+from typing import List
+from unittest.mock import Mock, patch
+
+from tests import testutils
+from trestlebot.tasks.sync_cac_content_task import (
+    OSCALProfileHelper,
+    SyncCacContentTask,
+)
+
+
+test_product = "rhel8"
+test_content_dir = "/content"
+test_prof = "simplified_nist_profile"
+
+
+def write_cac_profile(tmp_path: pathlib.Path, selections: List[str]) -> str:
+    """Write a CaC profile with the given selections."""
+    cac_profile = tmp_path.joinpath("example.profile")
+    selection_lines = "".join(f"  - {selected}\n" for selected in selections)
+    cac_profile.write_text(f"title: Example\nselections:\n{selection_lines}")
+    return str(cac_profile)
+
+
+def test_get_controls_without_policies(tmp_path: pathlib.Path) -> None:
+    """Test that the controls manager is not loaded without policy selections."""
+    cac_profile = write_cac_profile(tmp_path, ["rule_a", "var_a=1"])
+    task = SyncCacContentTask(
+        test_product,
+        cac_profile,
+        test_content_dir,
+        "service",
+        test_prof,
+        str(tmp_path),
+    )
+
+    with patch.object(SyncCacContentTask, "_load_controls_manager") as mock_load:
+        task._get_controls()
+        mock_load.assert_not_called()
+    assert task.controls == []
+
+
+def test_get_controls_with_policies(tmp_path: pathlib.Path) -> None:
+    """Test that controls are collected for each policy selection."""
+    cac_profile = write_cac_profile(
+        tmp_path, ["rule_a", "abcd-levels:all:low", "unknown:all"]
+    )
+    task = SyncCacContentTask(
+        test_product,
+        cac_profile,
+        test_content_dir,
+        "service",
+        test_prof,
+        str(tmp_path),
+    )
+
+    controls_manager = Mock()
+    controls_manager.policies = {"abcd-levels": Mock()}
+    controls_manager.get_all_controls_of_level.return_value = ["control_a"]
+    with patch.object(
+        SyncCacContentTask, "_load_controls_manager", return_value=controls_manager
+    ) as mock_load:
+        task._get_controls()
+        mock_load.assert_called_once()
+    controls_manager.get_all_controls_of_level.assert_called_once_with(
+        "abcd-levels", "low"
+    )
+    assert task.controls == ["control_a"]
+
+
+def test_profile_helper_load_reads_edited_catalog(tmp_trestle_dir: str) -> None:
+    """Test that loading a profile again reflects an edited catalog."""
+    trestle_root = pathlib.Path(tmp_trestle_dir)
+    _ = testutils.setup_for_profile(trestle_root, test_prof, "")
+    profile_path = trestle_root.joinpath("profiles", test_prof, "profile.json")
+    catalog_path = trestle_root.joinpath(
+        "catalogs", "simplified_nist_catalog", "catalog.json"
+    )
+
+    profile_helper = OSCALProfileHelper(trestle_root)
+    profile_helper.load(str(profile_path))
+    assert profile_helper.validate("AC-1") == "ac-1"
+
+    testutils.replace_string_in_file(str(catalog_path), '"AC-1"', '"AC-01"')
+    profile_helper = OSCALProfileHelper(trestle_root)
+    profile_helper.load(str(profile_path))
+    assert profile_helper.validate("AC-01") == "ac-1"
+    assert "AC-1" not in profile_helper.controls_by_label
+
+
+def test_get_rules_transformer_is_shared(tmp_path: pathlib.Path) -> None:
+    """Test that one rules transformer is created per task."""
+    cac_profile = write_cac_profile(tmp_path, ["rule_a"])
+    task = SyncCacContentTask(
+        test_product,
+        cac_profile,
+        test_content_dir,
+        "service",
+        test_prof,
+        str(tmp_path),
+    )
+
+    with patch(
+        "trestlebot.tasks.sync_cac_content_task.RulesTransformer"
+    ) as mock_transformer:
+        rules_transformer = task._get_rules_transformer()
+        assert task._get_rules_transformer() is rules_transformer
+        mock_transformer.assert_called_once_with(
+            test_content_dir, test_product, cac_profile
+        )
@@ -57,6 +57,55 @@ def test_sync_upstreams_task_with_filter(
     assert not (dest_trestle_root / "component-definitions" / "invalid_comp").exists()
 
 
+def test_sync_upstreams_task_missing_model_dir(
+    tmp_trestle_dir: str, tmp_repo: Tuple[str, Repo]
+) -> None:
+    """Test sync upstreams task with a model directory missing from the source"""
+    tmp_repo_path, repo = tmp_repo
+    source_trestle_root = pathlib.Path(tmp_repo_path)
+    setup_for_compdef(source_trestle_root, "test_comp", "test_comp")
+    shutil.rmtree(source_trestle_root / "system-security-plans", ignore_errors=True)
+    repo.git.add(all=True)
+    repo.index.commit("Adds test_comp")
+    sync = SyncUpstreamsTask(tmp_trestle_dir, [f"{tmp_repo_path}@main"])
+    assert sync.execute() == 0
+
+    dest_trestle_root = pathlib.Path(tmp_trestle_dir)
+    assert (dest_trestle_root / "component-definitions" / "test_comp").exists()
+
+
+def test_sync_upstreams_task_multiple_sources(
+    tmp_trestle_dir: str, tmp_repo: Tuple[str, Repo]
+) -> None:
+    """Test sync upstreams task takes models from the last source that has them"""
+    tmp_repo_path, repo = tmp_repo
+    source_trestle_root = pathlib.Path(tmp_repo_path)
+    setup_for_compdef(source_trestle_root, "test_comp", "test_comp")
+    repo.git.add(all=True)
+    repo.index.commit("Adds test_comp")
+
+    model_path = pathlib.Path(
+        "component-definitions", "test_comp", "component-definition.json"
+    )
+    repo.git.checkout("-b", "update")
+    source_model_path = source_trestle_root / model_path
+    source_model_path.write_text(source_model_path.read_text().replace("\n", "\r\n"))
+    repo.git.add(all=True)
+    repo.index.commit("Updates test_comp")
+    updated_model = source_model_path.read_bytes()
+    repo.git.checkout("main")
+
+    sync = SyncUpstreamsTask(
+        tmp_trestle_dir,
+        [f"{tmp_repo_path}@main", f"{tmp_repo_path}@update"],
+        validate=False,
+    )
+    assert sync.execute() == 0
+
+    dest_trestle_root = pathlib.Path(tmp_trestle_dir)
+    assert (dest_trestle_root / model_path).read_bytes() == updated_model
+
+
 def test_sync_upstream_invalid_source(tmp_trestle_dir: str) -> None:
     """Test sync upstreams task with invalid source"""
     sync = SyncUpstreamsTask(tmp_trestle_dir, ["invalid_source"])
@@ -99,6 +148,27 @@ def test_sync_upstream_invalid_model(
     assert sync.execute() == 0
 
 
+def test_sync_upstream_without_validation_copies_files(
+    tmp_trestle_dir: str, tmp_repo: Tuple[str, Repo]
+) -> None:
+    """Test sync upstreams task copies JSON models as is without validation"""
+    tmp_repo_path, repo = tmp_repo
+    source_trestle_root = pathlib.Path(tmp_repo_path)
+    setup_for_compdef(source_trestle_root, "test_comp", "test_comp")
+    repo.git.add(all=True)
+    repo.index.commit("Adds test_comp")
+    sync = SyncUpstreamsTask(tmp_trestle_dir, [f"{tmp_repo_path}@main"], validate=False)
+    assert sync.execute() == 0
+
+    model_path = pathlib.Path(
+        "component-definitions", "test_comp", "component-definition.json"
+    )
+    dest_trestle_root = pathlib.Path(tmp_trestle_dir)
+    assert (dest_trestle_root / model_path).read_bytes() == (
+        source_trestle_root / model_path
+    ).read_bytes()
+
+
 def test_sync_upstream_invalid_git(
     tmp_trestle_dir: str, tmp_repo: Tuple[str, Repo]
 ) -> None:
@@ -0,0 +1,153 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (c) 2024 Red Hat, Inc.
+
+
+"""Test for the CaC rules transformer."""
+
+import os
+import pathlib
+from typing import Generator
+from unittest.mock import Mock, patch
+
+import pytest
+
+from trestlebot.transformers.cac_transformer import (
+    RuleInfo,
+    RulesTransformer,
+    add_prop,
+    get_product_profiles,
+    get_product_yaml,
+    get_profile_params,
+    get_validation_component_mapping,
+)
+
+
+cac_module = "trestlebot.transformers.cac_transformer"
+test_root = "/content"
+test_product = "rhel8"
+test_profile = "products/rhel8/profiles/example.profile"
+test_profile_params = {
+    "var_a": {test_product: {"example": "1"}},
+    "var_b": {test_product: {"example": "2"}},
+}
+
+
+@pytest.fixture
+def rules_transformer() -> Generator[RulesTransformer, None, None]:
+    """Create a rules transformer without reading CaC content."""
+    with patch(f"{cac_module}.get_product_yaml"), patch(
+        f"{cac_module}.get_benchmark_root", return_value="/content/linux_os"
+    ), patch(f"{cac_module}.find_rule_dirs_in_paths", return_value=[]), patch(
+        f"{cac_module}.get_product_profiles", return_value={}
+    ), patch(
+        f"{cac_module}.get_profile_params", return_value=test_profile_params
+    ):
+        yield RulesTransformer(test_root, test_product, test_profile)
+
+
+def test_rules_transformer_shares_params(rules_transformer: RulesTransformer) -> None:
+    """Test that profile parameters are looked up once and shared by rules."""
+    with patch(
+        f"{cac_module}.get_variable_property", return_value="description"
+    ) as mock_property, patch(
+        f"{cac_module}.get_variable_options", return_value={"default": "1"}
+    ) as mock_options:
+        rule_a = RuleInfo("rule_a", "/content/linux_os/rule_a")
+        rule_b = RuleInfo("rule_b", "/content/linux_os/rule_b")
+        rules_transformer._get_params(test_root, rule_a)
+        rules_transformer._get_params(test_root, rule_b)
+
+        assert mock_property.call_count == 2
+        assert mock_options.call_count == 2
+
+    assert [param.id for param in rule_a._parameters] == ["var_a", "var_b"]
+    assert [param.selected_value for param in rule_a._parameters] == ["1", "2"]
+    for param_a, param_b in zip(rule_a._parameters, rule_b._parameters):
+        assert param_a is param_b
+
+
+def test_get_product_yaml_reloads_changed_file(tmp_path: pathlib.Path) -> None:
+    """Test that the product yaml is parsed again after the file changes."""
+    product_dir = tmp_path.joinpath("products", test_product)
+    product_dir.mkdir(parents=True)
+    product_yml = product_dir.joinpath("product.yml")
+    product_yml.write_text("product: rhel8\n")
+
+    with patch(
+        f"{cac_module}.load_product_yaml", side_effect=lambda path: object()
+    ) as mock_load:
+        product_yaml = get_product_yaml(str(tmp_path), test_product)
+        assert get_product_yaml(str(tmp_path), test_product) is product_yaml
+        assert mock_load.call_count == 1
+
+        stat = product_yml.stat()
+        os.utime(product_yml, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert get_product_yaml(str(tmp_path), test_product) is not product_yaml
+        assert mock_load.call_count == 2
+
+
+def test_get_product_profiles() -> None:
+    """Test that product profiles are keyed by id and the first one is kept."""
+    profiles = [
+        Mock(profile_id="example", rules=["rule_a"]),
+        Mock(profile_id="other", rules=["rule_b"]),
+        Mock(profile_id="example", rules=["rule_c"]),
+    ]
+    with patch(
+        f"{cac_module}.get_profiles_from_products", return_value=profiles
+    ) as mock_profiles:
+        profiles_by_id = get_product_profiles(test_root, test_product)
+        mock_profiles.assert_called_once_with(test_root, [test_product], sorted=True)
+
+    assert list(profiles_by_id) == ["example", "other"]
+    assert profiles_by_id["example"].rules == ["rule_a"]
+
+
+def test_get_profile_params() -> None:
+    """Test that profile parameters are read from the matching profile."""
+    profile = Mock(profile_id="example")
+    with patch(
+        f"{cac_module}.get_variables_from_profiles", return_value=test_profile_params
+    ) as mock_variables:
+        assert get_profile_params({"example": profile}, "example") == (
+            test_profile_params
+        )
+        mock_variables.assert_called_once_with([profile])
+
+        assert get_profile_params({"example": profile}, "missing") == {}
+        mock_variables.assert_called_once()
+
+
+def test_get_validation_component_mapping() -> None:
+    """Test that check entries follow the description or the last parameter."""
+    props = [
+        add_prop("Rule_Id", "rule_a", "rule_set_0"),
+        add_prop("Rule_Description", "Rule A", "rule_set_0"),
+        add_prop("Rule_Id", "rule_b", "rule_set_1"),
+        add_prop("Rule_Description", "Rule B", "rule_set_1"),
+        add_prop("Parameter_Id", "var_a", "rule_set_1"),
+        add_prop("Parameter_Description", "Var A", "rule_set_1"),
+        add_prop("Parameter_Value_Alternatives", "{}", "rule_set_1"),
+        add_prop("Parameter_Id", "var_b", "rule_set_1"),
+        add_prop("Parameter_Description", "Var B", "rule_set_1"),
+        add_prop("Parameter_Value_Alternatives", "{}", "rule_set_1"),
+    ]
+
+    mapping = get_validation_component_mapping(props)
+    assert [(entry["name"], entry["value"]) for entry in mapping] == [
+        ("Rule_Id", "rule_a"),
+        ("Rule_Description", "Rule A"),
+        ("Check_Id", "rule_a"),
+        ("Check_Description", "Rule A"),
+        ("Rule_Id", "rule_b"),
+        ("Rule_Description", "Rule B"),
+        ("Parameter_Id", "var_a"),
+        ("Parameter_Description", "Var A"),
+        ("Parameter_Value_Alternatives", "{}"),
+        ("Parameter_Id", "var_b"),
+        ("Parameter_Description", "Var B"),
+        ("Parameter_Value_Alternatives", "{}"),
+        ("Check_Id", "rule_b"),
+        ("Check_Description", "Rule B"),
+    ]
+    assert all(entry["remarks"] == "rule_set_1" for entry in mapping[4:])
@@ -5,6 +5,7 @@
 """Test for YAML Transformer."""
 
 import json
+import pathlib
 import re
 from typing import Any, Dict
 
@@ -56,6 +57,17 @@ def test_rule_transformer() -> None:
     assert rule.check.description == "My check description"
 
 
+def test_rule_transformer_from_bytes() -> None:
+    """Test that transforming from bytes matches transforming from a string."""
+    rule_path = YAML_TEST_DATA_PATH / "test_complete_rule.yaml"
+
+    transformer = ToRulesYAMLTransformer()
+    rule_from_bytes = transformer.transform(rule_path.read_bytes())
+    rule_from_str = transformer.transform(rule_path.read_text())
+
+    assert rule_from_bytes == rule_from_str
+
+
 def test_rules_transform_with_incomplete_rule() -> None:
     """Test rules transform with incomplete rule."""
     # Generate test json string
@@ -69,6 +81,18 @@ def test_rules_transform_with_incomplete_rule() -> None:
         transformer.transform(test_string)
 
 
+def test_rules_transform_reuses_loader_after_error() -> None:
+    """Test that a failed transform does not affect the next transform."""
+    rule_path = YAML_TEST_DATA_PATH / "test_complete_rule.yaml"
+    transformer = ToRulesYAMLTransformer()
+
+    with pytest.raises(RulesTransformerException):
+        transformer.transform('{"test_json": "test"}')
+
+    rule = transformer.transform(rule_path.read_bytes())
+    assert rule.name == "example_rule_1"
+
+
 def test_rules_transform_with_invalid_rule() -> None:
     """Test rules transform with invalid rule."""
     # load rule from path and close the file
@@ -128,3 +152,17 @@ def test_read_write_integration(test_rule: TrestleRule) -> None:
     read_rule = to_rules_transformer.transform(yaml_data)
 
     assert read_rule == test_rule
+
+
+def test_from_rules_transformer_reuses_dumper(
+    test_rule: TrestleRule, tmp_path: pathlib.Path
+) -> None:
+    """Test that repeated dumps with one transformer produce the same output."""
+    transformer = FromRulesYAMLTransformer()
+
+    yaml_data = transformer.transform(test_rule)
+    assert transformer.transform(test_rule) == yaml_data
+
+    rule_path = tmp_path / "rule.yaml"
+    transformer.write_to_file(test_rule, rule_path)
+    assert rule_path.read_text() == yaml_data
@@ -14,7 +14,6 @@ from trestlebot.cli.options.common import common_options, git_options
 from trestlebot.cli.utils import run_bot
 from trestlebot.const import ERROR_EXIT_CODE
 from trestlebot.tasks.base_task import TaskBase
-from trestlebot.tasks.sync_cac_content_task import SyncCacContentTask
 
 
 logger = logging.getLogger(__name__)
@@ -59,6 +58,9 @@ logger = logging.getLogger(__name__)
 )
 def sync_cac_content_cmd(ctx: click.Context, **kwargs: Any) -> None:
     """Transform CaC content to OSCAL component definition."""
+    # The task depends on the ssg package, which is slow to import. It is
+    # imported here so the other commands do not load it.
+    from trestlebot.tasks.sync_cac_content_task import SyncCacContentTask
 
     product = kwargs["product"]
     cac_content_root = kwargs["cac_content_root"]
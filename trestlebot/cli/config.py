@@ -15,6 +15,9 @@ from pydantic import BaseModel, DirectoryPath, ValidationError
 
 logger = logging.getLogger(__name__)
 
+# The LibYAML based loader is used when PyYAML was built with it
+_YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class TrestleBotConfigError(Exception):
     """Custom error to better format pydantic exceptions.
@@ -113,8 +116,8 @@ def load_from_file(file_path: Path) -> Optional[TrestleBotConfig]:
     """Load yaml file to trestlebot config object"""
     try:
         with open(file_path, "r") as config_file:
-            config_yaml = yaml.safe_load(config_file)
-            return TrestleBotConfig(**config_yaml)
+            config_yaml = yaml.load(config_file, Loader=_YAML_SAFE_LOADER)
+        return TrestleBotConfig(**config_yaml)
     except ValidationError as ex:
         raise TrestleBotConfigError(ex.errors())
     except (FileNotFoundError, TypeError):
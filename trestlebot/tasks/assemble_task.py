@@ -6,7 +6,6 @@
 
 import logging
 import os
-import pathlib
 from typing import Optional
 
 from trestlebot import const
@@ -25,6 +24,8 @@ class AssembleTask(TaskBase):
     Assemble Markdown into OSCAL content
     """
 
+    __slots__ = ("_authored_object", "_markdown_dir", "_version")
+
     def __init__(
         self,
         authored_object: AuthoredObjectBase,
@@ -63,12 +64,11 @@ class AssembleTask(TaskBase):
         if not os.path.exists(search_path):
             raise TaskException(f"Markdown directory {search_path} does not exist")
 
-        for model in self.iterate_models(pathlib.Path(search_path)):
+        for model in self.iterate_models(search_path):
             # Construct model path from markdown path. AuthoredObject already has
             # the working dir data as part of object construction.
             logger.info(f"Assembling model {model}")
-            model_base_name = os.path.basename(model)
-            model_path = os.path.join(self._markdown_dir, model_base_name)
+            model_path = os.path.join(self._markdown_dir, model.name)
             try:
                 self._authored_object.assemble(
                     markdown_path=model_path, version_tag=self._version
@@ -7,7 +7,7 @@
 import logging
 import os
 import pathlib
-from typing import Callable, List, Optional
+from typing import Callable, FrozenSet, List, Optional, Set
 
 import trestle.common.const as const
 import trestle.oscal.profile as prof
@@ -51,7 +51,11 @@ class FilterByProfile:
         catalog = ProfileResolver.get_resolved_profile_catalog(
             trestle_root, filter_profile_path
         )
-        self._control_ids = CatalogInterface(catalog).get_control_ids()
+        # Only the ids are needed, so the catalog is walked once without
+        # building the full control dictionary of a CatalogInterface.
+        self._control_ids: FrozenSet[str] = frozenset(
+            CatalogInterface.get_control_ids_from_catalog(catalog)
+        )
 
     def __call__(self, control_id: str) -> bool:
         """Filter controls by catalog."""
@@ -215,9 +219,14 @@ class RulesViewBuilder:
 
     def write_to_yaml(self, compdef_path: pathlib.Path) -> None:
         """Write the rules to YAML files in the rules view."""
+        # Rules of a component share a directory, so each directory is only
+        # created once.
+        component_dirs: Set[pathlib.Path] = set()
         for rule in self._rules:
             rule_path: pathlib.Path = compdef_path.joinpath(
                 rule.component.name, rule.name + YAML_EXTENSION
             )
-            rule_path.parent.mkdir(parents=True, exist_ok=True)
+            if rule_path.parent not in component_dirs:
+                rule_path.parent.mkdir(parents=True, exist_ok=True)
+                component_dirs.add(rule_path.parent)
             self._yaml_transformer.write_to_file(rule, rule_path)
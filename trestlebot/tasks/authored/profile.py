@@ -127,19 +127,19 @@ class AuthoredProfile(AuthoredObjectBase):
                     f"Error defining workspace name for profile {profile_name}"
                 )
 
-        # Update imports
-        profile_import: prof.Import = gens.generate_sample_model(prof.Import)
-        profile_import.href = const.TRESTLE_HREF_HEADING + import_path
-        profile_import.include_all = gens.generate_sample_model(IncludeAll)
+        # Update imports. The import and merge settings are small enough to be
+        # built directly rather than generated from sample models.
+        profile_import = prof.Import(
+            href=const.TRESTLE_HREF_HEADING + import_path, include_all=IncludeAll()
+        )
 
         profile_data.imports[0] = profile_import
 
         # Set up default values for merge settings.
-        merge_object: prof.Merge = gens.generate_sample_model(prof.Merge)
-        combine_object: prof.Combine = gens.generate_sample_model(prof.Combine)
-        combine_object.method = prof.CombinationMethodValidValues.merge
-        merge_object.combine = combine_object
-        merge_object.as_is = True
+        merge_object = prof.Merge(
+            combine=prof.Combine(method=prof.CombinationMethodValidValues.merge),
+            as_is=True,
+        )
 
         profile_data.merge = merge_object
 
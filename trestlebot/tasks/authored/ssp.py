@@ -56,8 +56,11 @@ class SSPIndex:
         # Try to load the current file. If it does not exist,
         # create an empty JSON file.
         try:
-            with open(self._index_path, "r") as file:
-                json_data = json.load(file)
+            # The index is read in one call and parsed from bytes once the
+            # file is closed.
+            with open(self._index_path, "rb") as file:
+                index_data = file.read()
+            json_data = json.loads(index_data)
 
             for ssp_name, ssp_info in json_data.items():
                 try:
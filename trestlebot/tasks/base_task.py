@@ -5,14 +5,30 @@
 """Trestle Bot base task for extensible bot pre-tasks"""
 
 import fnmatch
+import os
 import pathlib
+import re
 from abc import ABC, abstractmethod
-from typing import Callable, Iterable, List, Optional
+from typing import (
+    Callable,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    Union,
+)
 
 from trestle.common import const
 from trestle.common.file_utils import is_hidden
 
 
+# Characters that make a pattern a glob rather than a literal name
+_GLOB_CHARS = "*?["
+
+
 class TaskException(Exception):
     """An error during task execution"""
 
@@ -29,31 +45,91 @@ class ModelFilter:
     The skip list is applied first.
     """
 
+    __slots__ = (
+        "_include_model_list",
+        "_skip_model_list",
+        "_skip_names",
+        "_skip_regex",
+        "_include_names",
+        "_include_regex",
+        "_include_all",
+    )
+
     def __init__(self, skip_patterns: List[str], include_patterns: List[str]):
-        self._include_model_list: List[str] = include_patterns
-        self._skip_model_list: List[str] = [const.TRESTLE_KEEP_FILE] + skip_patterns
+        # Both lists are copied so later changes to the caller's lists do not
+        # leave them out of sync with the compiled patterns.
+        self._include_model_list: List[str] = list(include_patterns)
+        self._skip_model_list: List[str] = [const.TRESTLE_KEEP_FILE, *skip_patterns]
+        self._skip_names, self._skip_regex = self._compile_patterns(
+            self._skip_model_list
+        )
+        self._include_names, self._include_regex = self._compile_patterns(
+            self._include_model_list
+        )
+        # A bare wildcard include matches every name, so the include check can
+        # be skipped entirely. This is the default for the CLI commands.
+        self._include_all: bool = "*" in self._include_model_list
+
+    @staticmethod
+    def _compile_patterns(
+        patterns: List[str],
+    ) -> Tuple[FrozenSet[str], Optional[Pattern[str]]]:
+        """
+        Split glob patterns into literal names and a single regular expression.
+
+        Notes:
+            Patterns without wildcards are matched by set membership and the
+            rest by one regular expression built with fnmatch.translate.
+        """
+        names: Set[str] = set()
+        globs: List[str] = []
+        for pattern in patterns:
+            pattern = os.path.normcase(pattern)
+            if any(char in pattern for char in _GLOB_CHARS):
+                globs.append(pattern)
+            else:
+                names.add(pattern)
+
+        regex: Optional[Pattern[str]] = None
+        if globs:
+            regex = re.compile("|".join(fnmatch.translate(p) for p in globs))
+        return frozenset(names), regex
 
     def is_skipped(self, model_path: pathlib.Path) -> bool:
         """Check if the model is skipped through include or skip lists."""
-        if any(
-            fnmatch.fnmatch(model_path.name, pattern)
-            for pattern in self._skip_model_list
+        return self.is_name_skipped(model_path.name)
+
+    def is_name_skipped(self, model_name: str) -> bool:
+        """Check if the model file name is skipped through include or skip lists."""
+        model_name = os.path.normcase(model_name)
+        if model_name in self._skip_names or (
+            self._skip_regex is not None and self._skip_regex.match(model_name)
         ):
             return True
-        elif any(
-            fnmatch.fnmatch(model_path.name, pattern)
-            for pattern in self._include_model_list
+        elif (
+            self._include_all
+            or model_name in self._include_names
+            or (
+                self._include_regex is not None
+                and self._include_regex.match(model_name)
+            )
         ):
             return False
         else:
             return True
 
+    def filter_names(self, model_names: List[str]) -> List[str]:
+        """Return the model file names that are not skipped, in their original order."""
+        return [name for name in model_names if not self.is_name_skipped(name)]
+
 
 class TaskBase(ABC):
     """
     Abstract base class for tasks with a work directory.
     """
 
+    __slots__ = ("working_dir", "filter")
+
     def __init__(self, working_dir: str, model_filter: Optional[ModelFilter]) -> None:
         """
         Initialize base task.
@@ -62,35 +138,35 @@ class TaskBase(ABC):
             working_dir: Working directory to complete operations in.
             model_filter: Model filter to use for this task.
         """
-        self._working_dir = working_dir
+        self.working_dir: str = working_dir
         self.filter: Optional[ModelFilter] = model_filter
 
-    @property
-    def working_dir(self) -> str:
-        """Return the working directory"""
-        return self._working_dir
+    def iterate_models(
+        self, directory_path: Union[str, pathlib.Path]
+    ) -> Iterator[pathlib.Path]:
+        """
+        Iterate over the models in the working directory
 
-    def iterate_models(self, directory_path: pathlib.Path) -> Iterable[pathlib.Path]:
-        """Iterate over the models in the working directory"""
-        filtered_paths: Iterable[pathlib.Path]
+        Notes:
+            Hidden files are skipped, but hidden directories are included.
+        """
+        if not isinstance(directory_path, pathlib.Path):
+            directory_path = pathlib.Path(directory_path)
 
+        is_skipped: Optional[Callable[[str], bool]] = None
         if self.filter is not None:
-            is_skipped: Callable[[pathlib.Path], bool] = self.filter.is_skipped
-            filtered_paths = list(
-                filter(
-                    lambda p: not is_skipped(p) and (not is_hidden(p) or p.is_dir()),
-                    pathlib.Path.iterdir(directory_path),
-                )
-            )
-        else:
-            filtered_paths = list(
-                filter(
-                    lambda p: not is_hidden(p) or p.is_dir(),
-                    pathlib.Path.iterdir(directory_path),
-                )
-            )
-
-        return filtered_paths.__iter__()
+            is_skipped = self.filter.is_name_skipped
+
+        with os.scandir(directory_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if is_skipped is not None and is_skipped(name):
+                    continue
+                model_path = directory_path.joinpath(name)
+                # Only hidden entries need the directory check
+                if is_hidden(model_path) and not entry.is_dir():
+                    continue
+                yield model_path
 
     @abstractmethod
     def execute(self) -> int:
@@ -26,6 +26,8 @@ class RegenerateTask(TaskBase):
     Regenerate Trestle Markdown from OSCAL JSON content changes
     """
 
+    __slots__ = ("_authored_object", "_markdown_dir")
+
     def __init__(
         self,
         authored_object: AuthoredObjectBase,
@@ -60,11 +62,10 @@ class RegenerateTask(TaskBase):
         """
         model_dir = types.get_trestle_model_dir(self._authored_object)
 
-        search_path = os.path.join(self.working_dir, model_dir)
-        for model in self.iterate_models(pathlib.Path(search_path)):
+        search_path = pathlib.Path(self.working_dir, model_dir)
+        for model in self.iterate_models(search_path):
             logger.info(f"Regenerating model {model}")
-            model_base_name = os.path.basename(model)
-            model_path = os.path.join(model_dir, model_base_name)
+            model_path = os.path.join(model_dir, model.name)
 
             try:
                 self._authored_object.regenerate(
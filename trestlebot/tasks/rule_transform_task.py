@@ -5,12 +5,15 @@
 """Trestle Bot Rule Transform Tasks"""
 
 import configparser
+import hashlib
 import logging
 import os
 import pathlib
-from typing import List, Optional
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional
 
 import trestle.common.const as trestle_const
+from trestle.common.file_utils import is_hidden
 from trestle.tasks.base_task import TaskOutcome
 from trestle.tasks.csv_to_oscal_cd import CsvToOscalComponentDefinition
 
@@ -18,17 +21,23 @@ import trestlebot.const as const
 from trestlebot.tasks.base_task import ModelFilter, TaskBase, TaskException
 from trestlebot.transformers.base_transformer import RulesTransformerException
 from trestlebot.transformers.csv_transformer import CSVBuilder
+from trestlebot.transformers.trestle_rule import TrestleRule
 from trestlebot.transformers.yaml_transformer import ToRulesYAMLTransformer
 
 
 logger = logging.getLogger(__name__)
 
+# Number of transformed rules kept to reuse for identical rule content
+RULE_CACHE_SIZE = 4096
+
 
 class RuleTransformTask(TaskBase):
     """
     Transform rules into OSCAL content.
     """
 
+    __slots__ = ("_rule_view_dir", "_rule_transformer", "_rule_cache")
+
     def __init__(
         self,
         working_dir: str,
@@ -55,6 +64,9 @@ class RuleTransformTask(TaskBase):
 
         self._rule_view_dir = rules_view_dir
         self._rule_transformer: ToRulesYAMLTransformer = rule_transformer
+        # Rules shared between components are only transformed once. The least
+        # recently used rules are dropped once the cache is full.
+        self._rule_cache: "OrderedDict[bytes, TrestleRule]" = OrderedDict()
         super().__init__(working_dir, model_filter)
 
     def execute(self) -> int:
@@ -68,69 +80,129 @@ class RuleTransformTask(TaskBase):
         Returns:
          0 on success, raises an exception if not successful
         """
-        working_path: pathlib.Path = pathlib.Path(self.working_dir)
-        search_path: pathlib.Path = working_path.joinpath(self._rule_view_dir)
+        search_path: str = os.path.join(self.working_dir, self._rule_view_dir)
 
-        for compdef in self.iterate_models(search_path):
-            self._transform_components(compdef)
+        rule_paths_by_compdef = self._collect_rule_paths(search_path)
+        for component_def_name, rule_paths in rule_paths_by_compdef.items():
+            self._transform_components(component_def_name, rule_paths)
 
         return const.SUCCESS_EXIT_CODE
 
-    def _transform_components(self, component_definition_path: pathlib.Path) -> None:
-        """Transform components into an OSCAL component definition."""
+    def _collect_rule_paths(self, search_path: str) -> Dict[str, List[str]]:
+        """
+        Collect rule file paths grouped by component definition name.
+
+        Notes:
+            The rules view is walked once, following symlinked directories. The
+            model filter is applied to the names at every level.
+        """
+        filter_names: Optional[Callable[[List[str]], List[str]]] = None
+        if self.filter is not None:
+            filter_names = self.filter.filter_names
+
+        def raise_error(error: OSError) -> None:
+            raise error
+
+        rule_paths_by_compdef: Dict[str, List[str]] = {}
+        for root, dirs, files in os.walk(
+            search_path, onerror=raise_error, followlinks=True
+        ):
+            if filter_names is not None:
+                dirs[:] = filter_names(dirs)
+
+            relative_root = os.path.relpath(root, search_path)
+            if relative_root == os.curdir:
+                for name in dirs:
+                    rule_paths_by_compdef[name] = []
+                continue
+
+            parts = relative_root.split(os.sep)
+            if len(parts) == 1:
+                continue
+
+            # Rule files live directly in the component directory
+            dirs[:] = []
+            logger.debug(f"Collecting rules for component {parts[1]}")
+            rule_paths = rule_paths_by_compdef[parts[0]]
+            rule_names = files
+            if filter_names is not None:
+                rule_names = filter_names(rule_names)
+            for name in rule_names:
+                rule_path = os.path.join(root, name)
+                if is_hidden(pathlib.Path(rule_path)):
+                    continue
+                rule_paths.append(rule_path)
+
+        return rule_paths_by_compdef
+
+    def _transform_rule(self, rule_stream: bytes) -> TrestleRule:
+        """Transform rule content, reusing the result for identical content."""
+        digest = hashlib.blake2b(rule_stream, digest_size=16).digest()
+        rule = self._rule_cache.get(digest)
+        if rule is None:
+            rule = self._rule_transformer.transform(rule_stream)
+            self._rule_cache[digest] = rule
+            if len(self._rule_cache) > RULE_CACHE_SIZE:
+                self._rule_cache.popitem(last=False)
+        else:
+            self._rule_cache.move_to_end(digest)
+        return rule
+
+    def _transform_components(
+        self, component_def_name: str, rule_paths: List[str]
+    ) -> None:
+        """Transform component rules into an OSCAL component definition."""
         csv_builder: CSVBuilder = CSVBuilder()
-        logger.info(
-            f"Transforming rules for component definition {component_definition_path.name}"
-        )
+        logger.info(f"Transforming rules for component definition {component_def_name}")
 
         # To report all rule errors at once, we collect them in a list and
         # pretty print them in a raised exception
         transformation_errors: List[str] = []
-        for component in self.iterate_models(component_definition_path):
-            logger.debug(f"Transforming rules for component {component.name}")
-            for rule_path in self.iterate_models(component):
-                # Load the rule into memory as a stream to process
-                rule_stream = rule_path.read_text()
-
-                try:
-                    rule = self._rule_transformer.transform(rule_stream)
-                    csv_builder.add_row(rule)
-                except RulesTransformerException as e:
-                    transformation_errors.append(f"{rule_path.as_posix()}: {e}")
+        for rule_path in rule_paths:
+            # Load the rule into memory as a stream to process. Rules are
+            # passed to the transformer undecoded.
+            with open(rule_path, "rb") as rule_file:
+                rule_stream = rule_file.read()
+
+            try:
+                rule = self._transform_rule(rule_stream)
+                csv_builder.add_row(rule)
+            except RulesTransformerException as e:
+                transformation_errors.append(f"{rule_path}: {e}")
 
         if len(transformation_errors) > 0:
             transformation_error_str = "\n".join(transformation_errors)
             raise TaskException(
-                f"Failed to transform rules for component definition {component_definition_path.name}: \
+                f"Failed to transform rules for component definition {component_def_name}: \
                     {transformation_error_str}"
             )
         if csv_builder.row_count == 0:
             raise TaskException(
-                f"No rules found for component definition {component_definition_path.name}"
+                f"No rules found for component definition {component_def_name}"
             )
 
         # Write the CSV to disk
-        working_path: pathlib.Path = pathlib.Path(self.working_dir)
-        csv_file_name: str = f"{component_definition_path.name}.csv"
-        csv_path: pathlib.Path = working_path.joinpath(csv_file_name)
-        csv_builder.write_to_file(csv_path)
+        csv_path: str = os.path.join(self.working_dir, f"{component_def_name}.csv")
+        csv_builder.write_to_file(pathlib.Path(csv_path))
 
-        # Build config for CSV to OSCAL task
-        config = configparser.ConfigParser()
+        # Build config for CSV to OSCAL task. Absolute paths are used so the
+        # task does not depend on the current working directory. The values are
+        # used as is, so interpolation is disabled.
+        config = configparser.ConfigParser(interpolation=None)
 
         section_name = "task.csv-to-oscal-cd"
-        component_def_name = os.path.basename(component_definition_path)
+        output_path: str = os.path.join(
+            self.working_dir, trestle_const.MODEL_DIR_COMPDEF, component_def_name
+        )
         config[section_name] = {
             "title": f"Component definition for {component_def_name}",
             "version": "1.0",
-            "csv-file": f"{csv_file_name}",
-            "output-dir": f"{trestle_const.MODEL_DIR_COMPDEF}/{component_def_name}",
+            "csv-file": os.path.abspath(csv_path),
+            "output-dir": os.path.abspath(output_path),
             "output-overwrite": "true",
         }
 
-        original_directory = os.getcwd()
         try:
-            os.chdir(self.working_dir)
             section_proxy: configparser.SectionProxy = config[section_name]
             csv_to_oscal_task = CsvToOscalComponentDefinition(section_proxy)
             task_outcome = csv_to_oscal_task.execute()
@@ -140,6 +212,3 @@ class RuleTransformTask(TaskBase):
                 )
         except Exception as e:
             raise TaskException(f"Transform failed for {component_def_name}: {e}")
-
-        finally:
-            os.chdir(original_directory)
@@ -7,23 +7,25 @@ import logging
 import os
 import pathlib
 import re
-from typing import Dict, List, Optional, Pattern, Set
+import uuid
+from typing import Dict, Iterator, List, Optional, Pattern, Set, Union
 
 # from ssg.products import get_all
 from ssg.controls import Control, ControlsManager, Status
 from ssg.products import load_product_yaml, product_yaml_path
-from ssg.profiles import _load_yaml_profile_file, get_profiles_from_products
+from ssg.profiles import _load_yaml_profile_file
 from trestle.common.common_types import TypeWithParts, TypeWithProps
 from trestle.common.const import IMPLEMENTATION_STATUS, REPLACE_ME, TRESTLE_HREF_HEADING
 from trestle.common.list_utils import as_list, none_if_empty
 from trestle.common.model_utils import ModelUtils
-from trestle.core.catalog.catalog_interface import CatalogInterface
 from trestle.core.control_interface import ControlInterface
 from trestle.core.generators import generate_sample_model
 from trestle.core.models.file_content_type import FileContentType
 from trestle.core.profile_resolver import ProfileResolver
 from trestle.oscal.catalog import Catalog
-from trestle.oscal.common import Property
+from trestle.oscal.catalog import Control as OscalControl
+from trestle.oscal.catalog import Group
+from trestle.oscal.common import Part, Property
 from trestle.oscal.component import (
     ComponentDefinition,
     ControlImplementation,
@@ -47,6 +49,28 @@ from trestlebot.transformers.cac_transformer import (
 logger = logging.getLogger(__name__)
 
 SECTION_PATTERN = r"Section ([a-z]):"
+_SECTION_RE: Pattern[str] = re.compile(SECTION_PATTERN, re.IGNORECASE)
+
+
+def _iter_catalog_controls(catalog: Catalog) -> Iterator[OscalControl]:
+    """
+    Yield every control in a catalog, including sub-controls.
+
+    Notes:
+        Controls are yielded in the same order as the CatalogInterface
+        control dictionary, without recursion.
+    """
+    stack: List[Union[Group, OscalControl]] = []
+    stack.extend(reversed(as_list(catalog.controls)))
+    stack.extend(reversed(as_list(catalog.groups)))
+    while stack:
+        node = stack.pop()
+        if isinstance(node, Group):
+            stack.extend(reversed(as_list(node.groups)))
+            stack.extend(reversed(as_list(node.controls)))
+        else:
+            yield node
+            stack.extend(reversed(as_list(node.controls)))
 
 
 class OscalStatus:
@@ -64,23 +88,26 @@ class OscalStatus:
     IMPLEMENTED = "implemented"
     PARTIAL = "partial"
 
+    _SSG_STATUS_MAP: Dict[str, str] = {
+        Status.INHERENTLY_MET: IMPLEMENTED,
+        Status.DOES_NOT_MEET: ALTERNATIVE,
+        Status.DOCUMENTATION: IMPLEMENTED,
+        Status.AUTOMATED: IMPLEMENTED,
+        Status.MANUAL: ALTERNATIVE,
+        Status.PLANNED: PLANNED,
+        Status.PARTIAL: PARTIAL,
+        Status.SUPPORTED: IMPLEMENTED,
+        Status.PENDING: ALTERNATIVE,
+        Status.NOT_APPLICABLE: NOT_APPLICABLE,
+    }
+
     @staticmethod
     def from_string(source: str) -> str:
-        data = {
-            Status.INHERENTLY_MET: OscalStatus.IMPLEMENTED,
-            Status.DOES_NOT_MEET: OscalStatus.ALTERNATIVE,
-            Status.DOCUMENTATION: OscalStatus.IMPLEMENTED,
-            Status.AUTOMATED: OscalStatus.IMPLEMENTED,
-            Status.MANUAL: OscalStatus.ALTERNATIVE,
-            Status.PLANNED: OscalStatus.PLANNED,
-            Status.PARTIAL: OscalStatus.PARTIAL,
-            Status.SUPPORTED: OscalStatus.IMPLEMENTED,
-            Status.PENDING: OscalStatus.ALTERNATIVE,
-            Status.NOT_APPLICABLE: OscalStatus.NOT_APPLICABLE,
-        }
-        if source not in data.keys():
+        data = OscalStatus._SSG_STATUS_MAP
+        try:
+            return data[source]
+        except KeyError:
             raise ValueError(f"Invalid status: {source}. Use one of {data.keys()}")
-        return data.get(source)  # type: ignore
 
     STATUSES = {PLANNED, NOT_APPLICABLE, ALTERNATIVE, IMPLEMENTED, PARTIAL}
 
@@ -105,7 +132,7 @@ class OSCALProfileHelper:
             show_value_warnings=True,
         )
 
-        for control in CatalogInterface(resolved_catalog).get_all_controls_from_dict():
+        for control in _iter_catalog_controls(resolved_catalog):
             self.profile_controls.add(control.id)
             label = ControlInterface.get_label(control)
             if label:
@@ -116,29 +143,37 @@ class OSCALProfileHelper:
         self,
         control: TypeWithParts,
     ) -> None:
-        """Handle parts of a control."""
-        if control.parts:
-            for part in control.parts:
-                if not part.id:
-                    continue
-                self.profile_controls.add(part.id)
-                label = ControlInterface.get_label(part)
-                # Avoiding key collision here. The higher level control object will take
-                # precedence.
-                if label and label not in self.controls_by_label.keys():
-                    self.controls_by_label[label] = part.id
-                self._handle_parts(part)
+        """
+        Handle parts of a control.
+
+        Notes:
+            Parts without an id are skipped along with their sub-parts.
+        """
+        stack: List[Part] = list(reversed(as_list(control.parts)))
+        while stack:
+            part = stack.pop()
+            if not part.id:
+                continue
+            self.profile_controls.add(part.id)
+            label = ControlInterface.get_label(part)
+            # Avoiding key collision here. The higher level control object will take
+            # precedence.
+            if label and label not in self.controls_by_label:
+                self.controls_by_label[label] = part.id
+            stack.extend(reversed(as_list(part.parts)))
 
     def validate(self, control_id: str) -> Optional[str]:
         """Validate that the control id exists in the catalog and return the id"""
-        if control_id in self.controls_by_label.keys():
+        # Called for every control and statement, so the label map is only
+        # looked up once
+        labeled_control_id = self.controls_by_label.get(control_id)
+        if labeled_control_id is not None:
             logger.debug(f"Found control {control_id} in control labels")
-            return self.controls_by_label.get(control_id)
+            return labeled_control_id
         elif control_id in self.profile_controls:
             logger.debug(f"Found control {control_id} in profile control ids")
             return control_id
 
-        logger.debug(f"Control {control_id} does not exist in the profile")
         return None
 
 
@@ -158,12 +193,14 @@ class SyncCacContentTask(TaskBase):
 
         self.product: str = product
         self.cac_profile: str = cac_profile
+        self._cac_profile_id: str = os.path.basename(cac_profile).split(".profile")[0]
         self.cac_content_root: str = cac_content_root
         self.compdef_type: str = compdef_type
         self.oscal_profile: str = oscal_profile
         self.rules: List[str] = []
         self.controls: List[Control] = list()
         self.rules_by_id: Dict[str, RuleInfo] = dict()
+        self._rules_transformer: Optional[RulesTransformer] = None
 
         self.profile_href: str = ""
         self.profile_path: str = ""
@@ -173,20 +210,30 @@ class SyncCacContentTask(TaskBase):
 
     def _collect_rules(self) -> None:
         """Collect all rules from the product profile."""
-        profiles = get_profiles_from_products(self.cac_content_root, [self.product])
-        cac_profile_id = os.path.basename(self.cac_profile).split(".profile")[0]
-        for profile in profiles:
-            if profile.profile_id == cac_profile_id:
-                self.rules = profile.rules
-                break
+        # The product profiles are loaded once by the rules transformer
+        profiles = self._get_rules_transformer().profiles_by_id
+        profile = profiles.get(self._cac_profile_id)
+        if profile is not None:
+            self.rules = profile.rules
+
+    def _get_rules_transformer(self) -> RulesTransformer:
+        """
+        Get the rules transformer for the product profile.
+
+        Notes:
+            One transformer is shared by the rule properties and the controls.
+        """
+        if self._rules_transformer is None:
+            self._rules_transformer = RulesTransformer(
+                self.cac_content_root,
+                self.product,
+                self.cac_profile,
+            )
+        return self._rules_transformer
 
     def _get_rules_properties(self) -> List[Property]:
         """Create all of the top-level component properties for rules."""
-        rules_transformer = RulesTransformer(
-            self.cac_content_root,
-            self.product,
-            self.cac_profile,
-        )
+        rules_transformer = self._get_rules_transformer()
         rules_transformer.add_rules(self.rules)
         self.rules_by_id = rules_transformer.get_all_rule_objs()
         rules: List[RuleInfo] = list(self.rules_by_id.values())
@@ -226,6 +273,9 @@ class SyncCacContentTask(TaskBase):
     def _load_controls_manager(self) -> ControlsManager:
         """
         Loads and initializes a ControlsManager instance.
+
+        Notes:
+            The manager is loaded once per run, when the controls are collected.
         """
         product_yml_path = product_yaml_path(self.cac_content_root, self.product)
         product_yaml = load_product_yaml(product_yml_path)
@@ -236,22 +286,28 @@ class SyncCacContentTask(TaskBase):
 
     def _get_controls(self) -> None:
         """Collect controls selected by profile."""
-        controls_manager = self._load_controls_manager()
-        policies = controls_manager.policies
         profile_yaml = _load_yaml_profile_file(self.cac_profile)
         selections = profile_yaml.get("selections", [])
-        for selected in selections:
-            if ":" in selected:
-                parts = selected.split(":")
-                if len(parts) == 3:
-                    policy_id, level = parts[0], parts[2]
-                else:
-                    policy_id, level = parts[0], "all"
-                policy = policies.get(policy_id)
-                if policy is not None:
-                    self.controls.extend(
-                        controls_manager.get_all_controls_of_level(policy_id, level)
-                    )
+        policy_selections = [selected for selected in selections if ":" in selected]
+        # Loading the controls manager parses every policy in the content,
+        # so it is skipped when the profile does not select any policy.
+        if not policy_selections:
+            logger.debug(f"No policies selected in profile {self.cac_profile}")
+            return
+
+        controls_manager = self._load_controls_manager()
+        policies = controls_manager.policies
+        for selected in policy_selections:
+            parts = selected.split(":")
+            if len(parts) == 3:
+                policy_id, level = parts[0], parts[2]
+            else:
+                policy_id, level = parts[0], "all"
+            policy = policies.get(policy_id)
+            if policy is not None:
+                self.controls.extend(
+                    controls_manager.get_all_controls_of_level(policy_id, level)
+                )
 
     @staticmethod
     def _build_sections_dict(
@@ -259,19 +315,24 @@ class SyncCacContentTask(TaskBase):
         section_pattern: Pattern[str],
     ) -> Dict[str, List[str]]:
         """Find all sections in the control response and build a dictionary of them."""
-        lines = control_response.split("\n")
-
         sections_dict: Dict[str, List[str]] = dict()
-        current_section_label = None
-
-        for line in lines:
-            match = section_pattern.match(line)
-
+        # Most responses have no sections. A single search over the whole
+        # response rules that out without splitting it and matching each line.
+        if section_pattern.search(control_response) is None:
+            return sections_dict
+
+        # Lines are appended to the current section's list directly rather
+        # than looked up by label. Splitting on "\n" only, unlike splitlines,
+        # keeps other line break characters in the section content.
+        match_section = section_pattern.match
+        current_section: Optional[List[str]] = None
+        for line in control_response.split("\n"):
+            match = match_section(line)
             if match:
-                current_section_label = match.group(1)
-                sections_dict[current_section_label] = [line]
-            elif current_section_label is not None:
-                sections_dict[current_section_label].append(line)
+                current_section = [line]
+                sections_dict[match.group(1)] = current_section
+            elif current_section is not None:
+                current_section.append(line)
 
         return sections_dict
 
@@ -303,11 +364,11 @@ class SyncCacContentTask(TaskBase):
 
     def _create_statement(self, statement_id: str, description: str = "") -> Statement:
         """Create a statement."""
-        statement = generate_sample_model(Statement)
-        statement.statement_id = statement_id
-        if description:
-            statement.description = description
-        return statement
+        return Statement(
+            statement_id=statement_id,
+            uuid=str(uuid.uuid4()),
+            description=description or REPLACE_ME,
+        )
 
     def _handle_response(
         self,
@@ -323,22 +384,20 @@ class SyncCacContentTask(TaskBase):
         """
         # REPLACE_ME is used as a generic string if no control notes
         control_response = control.notes or REPLACE_ME
-        pattern = re.compile(SECTION_PATTERN, re.IGNORECASE)
-        sections_dict = self._build_sections_dict(control_response, pattern)
+        sections_dict = self._build_sections_dict(control_response, _SECTION_RE)
         oscal_status = OscalStatus.from_string(control.status)
 
         if sections_dict:
             self._add_response_by_status(implemented_req, oscal_status, REPLACE_ME)
             implemented_req.statements = list()
+            statement_prefix = f"{implemented_req.control_id}_smt."
             for section_label, section_content in sections_dict.items():
-                statement_id = self.profile.validate(
-                    f"{implemented_req.control_id}_smt.{section_label}"
-                )
+                statement_id = self.profile.validate(statement_prefix + section_label)
                 if statement_id is None:
                     continue
 
                 section_content_str = "\n".join(section_content)
-                section_content_str = pattern.sub("", section_content_str)
+                section_content_str = _SECTION_RE.sub("", section_content_str)
                 statement = self._create_statement(
                     statement_id, section_content_str.strip()
                 )
@@ -354,12 +413,7 @@ class SyncCacContentTask(TaskBase):
         Notes: Rule ids with an "=" are parameters and should not be included
         # when searching for rules.
         """
-        processed_rule_ids: List[str] = list()
-        for rule_id in rule_ids:
-            parts = rule_id.split("=")
-            if len(parts) == 1:
-                processed_rule_ids.append(rule_id)
-        return processed_rule_ids
+        return [rule_id for rule_id in rule_ids if "=" not in rule_id]
 
     def _attach_rules(
         self,
@@ -369,8 +423,8 @@ class SyncCacContentTask(TaskBase):
     ) -> None:
         """Add rules to a type with props."""
         all_props: List[Property] = as_list(type_with_props.props)
-        all_rule_ids = self.rules_by_id.keys()
-        error_rules = list(filter(lambda x: x not in all_rule_ids, rule_ids))
+        rules_by_id = self.rules_by_id
+        error_rules = [rule_id for rule_id in rule_ids if rule_id not in rules_by_id]
         if error_rules:
             raise ValueError(f"Could not find rules: {', '.join(error_rules)}")
         rule_properties: List[Property] = rules_transformer.get_rule_id_props(rule_ids)
@@ -381,21 +435,21 @@ class SyncCacContentTask(TaskBase):
         self, control_implementation: ControlImplementation
     ) -> None:
         """Add set parameters to a control implementation."""
-        rules: List[RuleInfo] = list(self.rules_by_id.values())
-        params = []
-        for rule in rules:
-            params.extend(rule._parameters)
-        param_selections = {param.id: param.selected_value for param in params}
+        # Later rules override the values of parameters shared with earlier ones
+        param_selections = {
+            param.id: param.selected_value
+            for rule in self.rules_by_id.values()
+            for param in rule._parameters
+        }
 
         if param_selections:
             all_set_params: List[SetParameter] = as_list(
                 control_implementation.set_parameters
             )
-            for param_id, value in param_selections.items():
-                set_param = generate_sample_model(SetParameter)
-                set_param.param_id = param_id
-                set_param.values = [value]
-                all_set_params.append(set_param)
+            all_set_params.extend(
+                SetParameter(param_id=param_id, values=[value])
+                for param_id, value in param_selections.items()
+            )
             control_implementation.set_parameters = none_if_empty(all_set_params)
 
     def _create_implemented_requirement(
@@ -403,11 +457,14 @@ class SyncCacContentTask(TaskBase):
     ) -> Optional[ImplementedRequirement]:
         """Create implemented requirement from a control object"""
 
-        logger.info(f"Creating implemented requirement for {control.id}")
         control_id = self.profile.validate(control.id)
         if control_id:
-            implemented_req = generate_sample_model(ImplementedRequirement)
-            implemented_req.control_id = control_id
+            logger.info(f"Creating implemented requirement for {control.id}")
+            implemented_req = ImplementedRequirement(
+                uuid=str(uuid.uuid4()),
+                control_id=control_id,
+                description=REPLACE_ME,
+            )
             self._handle_response(implemented_req, control)
             rule_ids = self._process_rule_ids(control.rules)
             self._attach_rules(implemented_req, rule_ids, rules_transformer)
@@ -420,18 +477,23 @@ class SyncCacContentTask(TaskBase):
         ci.source = self.profile_href
         all_implement_reqs = list()
         self._get_controls()
-        rules_transformer = RulesTransformer(
-            self.cac_content_root,
-            self.product,
-            self.cac_profile,
-        )
+        rules_transformer = self._get_rules_transformer()
 
+        # Controls outside the profile are reported once for the whole policy
+        skipped_control_ids: List[str] = []
         for control in self.controls:
             implemented_req = self._create_implemented_requirement(
                 control, rules_transformer
             )
             if implemented_req:
                 all_implement_reqs.append(implemented_req)
+            else:
+                skipped_control_ids.append(control.id)
+        if skipped_control_ids:
+            logger.debug(
+                f"Skipped {len(skipped_control_ids)} controls not in the profile: "
+                f"{', '.join(skipped_control_ids)}"
+            )
         ci.implemented_requirements = all_implement_reqs
         self._add_set_parameters(ci)
         return ci
@@ -453,42 +515,45 @@ class SyncCacContentTask(TaskBase):
     ) -> None:
         """Update existed OSCAL component definition."""
         compdef = ComponentDefinition.oscal_read(cd_json)
-        components_titles = []
         updated = False
-        for index, component in enumerate(compdef.components):
-            components_titles.append(component.title)
-            # Check if the component exists and needs to be updated
-            if component.title == oscal_component.title:
-                if not ModelUtils.models_are_equivalent(
-                    component.props, oscal_component.props, ignore_all_uuid=True
-                ):
-                    logger.info(f"Component props of {component.title} has an update")
-                    compdef.components[index].props = oscal_component.props
-                    updated = True
-                if not ModelUtils.models_are_equivalent(
-                    component.control_implementations,
-                    oscal_component.control_implementations,
-                    ignore_all_uuid=True,
-                ):
-                    logger.info(
-                        f"Control implementations of {component.title} has an update"
-                    )
-                    compdef.components[index].control_implementations = (
-                        oscal_component.control_implementations
-                    )
-                    updated = True
-                if updated:
-                    break
-
-        if oscal_component.title not in components_titles:
+        # A single title is looked up per update, so the scan stops at the
+        # first component with a matching title
+        component_index = next(
+            (
+                index
+                for index, component in enumerate(compdef.components)
+                if component.title == oscal_component.title
+            ),
+            None,
+        )
+        if component_index is None:
             logger.info(f"Component {oscal_component.title} needs to be added")
             compdef.components.append(oscal_component)
             updated = True
+        else:
+            # Check if the existing component needs to be updated
+            component = compdef.components[component_index]
+            if not ModelUtils.models_are_equivalent(
+                component.props, oscal_component.props, ignore_all_uuid=True
+            ):
+                logger.info(f"Component props of {component.title} has an update")
+                component.props = oscal_component.props
+                updated = True
+            if not ModelUtils.models_are_equivalent(
+                component.control_implementations,
+                oscal_component.control_implementations,
+                ignore_all_uuid=True,
+            ):
+                logger.info(
+                    f"Control implementations of {component.title} has an update"
+                )
+                component.control_implementations = (
+                    oscal_component.control_implementations
+                )
+                updated = True
 
         if updated:
-            compdef.metadata.version = str(
-                "{:.1f}".format(float(compdef.metadata.version) + 0.1)
-            )
+            compdef.metadata.version = f"{float(compdef.metadata.version) + 0.1:.1f}"
             ModelUtils.update_last_modified(compdef)
             compdef.oscal_write(cd_json)
             logger.info(f"Component definition: {cd_json} is updated")
@@ -503,8 +568,7 @@ class SyncCacContentTask(TaskBase):
         component_definition.metadata.title = f"Component definition for {self.product}"
         component_definition.metadata.version = "1.0"
         component_definition.components = list()
-        cd_dir = pathlib.Path(os.path.dirname(cd_json))
-        cd_dir.mkdir(exist_ok=True, parents=True)
+        cd_json.parent.mkdir(exist_ok=True, parents=True)
         component_definition.components.append(oscal_component)
         component_definition.oscal_write(cd_json)
 
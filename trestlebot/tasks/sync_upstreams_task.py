@@ -6,13 +6,17 @@
 
 import argparse
 import logging
+import os
 import pathlib
+import shutil
 import tempfile
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from typing import Dict, Iterator, List, Optional
 
 from git import GitCommandError, Repo
 from trestle.common import file_utils
-from trestle.common.const import MODEL_DIR_LIST, VAL_MODE_ALL
+from trestle.common.const import MODEL_DIR_LIST, MODEL_TYPE_TO_MODEL_DIR, VAL_MODE_ALL
 from trestle.common.err import TrestleError
 from trestle.common.model_utils import ModelUtils
 from trestle.core.base_model import OscalBaseModel
@@ -26,10 +30,21 @@ from trestlebot.tasks.base_task import ModelFilter, TaskBase, TaskException
 
 logger = logging.getLogger(__name__)
 
+# Number of upstream sources cloned at the same time
+UPSTREAM_FETCH_WORKERS = 8
+
+# File name of a model stored as a single JSON file, by model directory
+_MODEL_FILE_NAMES: Dict[str, str] = {
+    model_dir: f"{model_type}.json"
+    for model_type, model_dir in MODEL_TYPE_TO_MODEL_DIR.items()
+}
+
 
 class SyncUpstreamsTask(TaskBase):
     """Sync OSCAL content from upstream git repositories."""
 
+    __slots__ = ("sources", "validate")
+
     def __init__(
         self,
         working_dir: str,
@@ -68,40 +83,76 @@ class SyncUpstreamsTask(TaskBase):
         Execute task
         Returns:
             0 on success, raises an exception if not successful
+
+        Notes:
+            Sources are cloned concurrently but copied in order, so the last
+            source with a model wins.
         """
         logger.info(f"Syncing from {len(self.sources)} source(s) to {self.working_dir}")
-        for source in self.sources:
-            self._fetch_oscal_content(source)
+        if not self.sources:
+            return const.SUCCESS_EXIT_CODE
+
+        with ExitStack() as stack:
+            workspaces: List[pathlib.Path] = [
+                pathlib.Path(
+                    stack.enter_context(
+                        tempfile.TemporaryDirectory(dir=self.working_dir)
+                    )
+                )
+                for _ in self.sources
+            ]
+            max_workers = min(len(self.sources), UPSTREAM_FETCH_WORKERS)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                fetches = [
+                    executor.submit(self._fetch_oscal_content, source, workspace)
+                    for source, workspace in zip(self.sources, workspaces)
+                ]
+            for source, workspace, fetch in zip(self.sources, workspaces, fetches):
+                fetch.result()
+                self._copy_oscal_content(source, workspace)
         return const.SUCCESS_EXIT_CODE
 
-    def _fetch_oscal_content(self, source: str) -> None:
-        """Fetch OSCAL content from upstream sources."""
+    def _fetch_oscal_content(
+        self, source: str, upstream_trestle_workspace: pathlib.Path
+    ) -> None:
+        """Fetch OSCAL content from an upstream source into a workspace."""
         repo: Optional[Repo] = None
         logger.info(f"Syncing content from {source}")
-        try:
-            with tempfile.TemporaryDirectory(dir=self.working_dir) as temporary_git_dir:
+        with self._handle_source_errors(source):
+            try:
                 self.validate_source(source)
                 repo_url, ref = source.split("@")
-                upstream_trestle_workspace: pathlib.Path = pathlib.Path(
-                    temporary_git_dir
-                )
-                Repo.clone_from(repo_url, upstream_trestle_workspace)
-                repo = Repo(upstream_trestle_workspace)
+                repo = Repo.clone_from(repo_url, upstream_trestle_workspace)
                 repo.git.checkout(ref)
+            finally:
+                if repo is not None:
+                    repo.close()
 
-                validator: Optional[Validator] = None
-                if self.validate:
-                    args = argparse.Namespace(mode=VAL_MODE_ALL, quiet=True)
-                    validator = validator_factory.get(args)
-
-                for model_dir in MODEL_DIR_LIST:
-                    self._copy_validate_models(
-                        upstream_trestle_workspace,
-                        pathlib.Path(self.working_dir),
-                        model_dir,
-                        validator,
-                    )
-                logger.info(f"Successfully copied from {source}")
+    def _copy_oscal_content(
+        self, source: str, upstream_trestle_workspace: pathlib.Path
+    ) -> None:
+        """Copy the OSCAL content fetched from an upstream source."""
+        with self._handle_source_errors(source):
+            validator: Optional[Validator] = None
+            if self.validate:
+                args = argparse.Namespace(mode=VAL_MODE_ALL, quiet=True)
+                validator = validator_factory.get(args)
+
+            for model_dir in MODEL_DIR_LIST:
+                self._copy_validate_models(
+                    upstream_trestle_workspace,
+                    pathlib.Path(self.working_dir),
+                    model_dir,
+                    validator,
+                )
+            logger.info(f"Successfully copied from {source}")
+
+    @staticmethod
+    @contextmanager
+    def _handle_source_errors(source: str) -> Iterator[None]:
+        """Raise errors from syncing a source as task exceptions."""
+        try:
+            yield
         except ValueError as e:
             raise TaskException(f"Invalid source {source}: {e}")
         except GitCommandError as e:
@@ -116,9 +167,6 @@ class SyncUpstreamsTask(TaskBase):
             raise TaskException(
                 f"Unexpected error while fetching content from {source}: {e}"
             )
-        finally:
-            if repo is not None:
-                repo.close()
 
     def validate_source(self, source: str) -> None:
         """Validate the source string."""
@@ -135,11 +183,21 @@ class SyncUpstreamsTask(TaskBase):
         """Copy models from upstream source to trestle workspace."""
         model_search_path = source_trestle_root.joinpath(model_dir)
         # The model directories are created by default with trestle init, but
-        # they can be deleted.
-        if not model_search_path.exists():
+        # they can be deleted. A missing directory is detected when it is
+        # read rather than with a separate existence check.
+        try:
+            model_paths = list(self.iterate_models(model_search_path))
+        except FileNotFoundError:
             return
         logger.debug(f"Copying models from {model_search_path}")
-        for model_path in self.iterate_models(model_search_path):
+        for model_path in model_paths:
+            # Without validation, a model stored as a single JSON file does
+            # not need to be parsed and written again
+            if validator is None and self._copy_model_file(
+                model_path, destination_trestle_root, model_dir
+            ):
+                continue
+
             model: OscalBaseModel
             _, _, model = ModelUtils.load_distributed(
                 model_path.absolute(), source_trestle_root.absolute()
@@ -160,3 +218,37 @@ class SyncUpstreamsTask(TaskBase):
             ModelUtils.save_top_level_model(
                 model, destination_trestle_root, model_name, FileContentType.JSON
             )
+
+    @staticmethod
+    def _copy_model_file(
+        model_path: pathlib.Path,
+        destination_trestle_root: pathlib.Path,
+        model_dir: str,
+    ) -> bool:
+        """
+        Copy a model stored as a single JSON file to the trestle workspace.
+
+        Returns:
+            True if the model was copied. False if the model is split across
+            files or not stored as JSON, in which case it must be loaded and
+            saved to be merged into a single JSON file.
+        """
+        file_name = _MODEL_FILE_NAMES[model_dir]
+        try:
+            with os.scandir(model_path) as entries:
+                model_entries = [
+                    entry for entry in entries if not entry.name.startswith(".")
+                ]
+        except NotADirectoryError:
+            return False
+        if (
+            len(model_entries) != 1
+            or model_entries[0].name != file_name
+            or not model_entries[0].is_file()
+        ):
+            return False
+
+        destination_dir = destination_trestle_root.joinpath(model_dir, model_path.name)
+        destination_dir.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(model_entries[0].path, destination_dir.joinpath(file_name))
+        return True
@@ -5,6 +5,7 @@
 
 import logging
 import os
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 from ssg.products import load_product_yaml, product_yaml_path
@@ -17,7 +18,6 @@ from ssg.variables import (
 )
 from ssg.yaml import open_and_macro_expand_from_dir
 from trestle.common.const import TRESTLE_GENERIC_NS
-from trestle.core.generators import generate_sample_model
 from trestle.oscal.common import Property
 from trestle.tasks.csv_to_oscal_cd import (
     PARAMETER_DESCRIPTION,
@@ -34,11 +34,42 @@ logger = logging.getLogger(__name__)
 TRESTLE_CD_NS = f"{TRESTLE_GENERIC_NS}/cd"
 
 
+@lru_cache(maxsize=16)
+def _load_product_yaml(product_yml_path: str, mtime_ns: int) -> Any:
+    """Load a product yaml, cached by path and modification time."""
+    return load_product_yaml(product_yml_path)
+
+
+def get_product_yaml(root: str, product: str) -> Any:
+    """
+    Load the product yaml of a product in the CaC content.
+
+    Notes:
+        The result is cached until the file changes and must not be modified.
+    """
+    product_yml_path = product_yaml_path(root, product)
+    mtime_ns = os.stat(product_yml_path).st_mtime_ns
+    return _load_product_yaml(product_yml_path, mtime_ns)
+
+
+def get_product_profiles(root: str, product: str) -> Dict[str, Any]:
+    """
+    Load the profiles of a product in the CaC content, keyed by profile id.
+
+    Notes:
+        Profiles are loaded in sorted order and the first one found for an id
+        is kept.
+    """
+    profiles_by_id: Dict[str, Any] = dict()
+    for profile in get_profiles_from_products(root, [product], sorted=True):
+        profiles_by_id.setdefault(profile.profile_id, profile)
+    return profiles_by_id
+
+
 def get_component_info(product_name: str, cac_path: str) -> Tuple[str, str]:
     """Get the product name from product yml file via the SSG library."""
     if product_name and cac_path:
-        product_yml_path = product_yaml_path(cac_path, product_name)
-        product = load_product_yaml(product_yml_path)
+        product = get_product_yaml(cac_path, product_name)
         component_title = product._primary_data.get("product")
         component_description = product._primary_data.get("full_name")
         return (component_title, component_description)
@@ -68,9 +99,13 @@ def get_validation_component_mapping(props: Property) -> List[Dict[str, str]]:
         "Check_Description" entry.
     """
     transformed_list = [transform_property(prop) for prop in props]
-    rule_check_mapping = []
-    for prop in transformed_list:
-        rule_check_mapping.append(prop)
+    # The check entries of a rule follow its description, or its last
+    # parameter if it has any. The position is tracked by index so the entries
+    # are placed in one pass instead of being moved for each parameter.
+    check_entries_by_index: Dict[int, List[Dict[str, str]]] = dict()
+    check_entries: List[Dict[str, str]] = list()
+    check_index = -1
+    for index, prop in enumerate(transformed_list):
         if prop["name"] == "Rule_Id":
             check_id_entry = {
                 "name": "Check_Id",
@@ -85,46 +120,43 @@ def get_validation_component_mapping(props: Property) -> List[Dict[str, str]]:
                 "value": prop["value"],
                 "remarks": prop["remarks"],
             }
-            # Append the Check entry follow Rule_Description
-            rule_check_mapping.append(check_id_entry)
-            rule_check_mapping.append(check_description_entry)
-        # If this rule has paramters, append the Check entry follow paramters
+            check_entries = [check_id_entry, check_description_entry]
+            check_index = index
+            check_entries_by_index[check_index] = check_entries
+        # If this rule has parameters, the Check entries follow the parameters
         if prop["name"] == "Parameter_Value_Alternatives":
-            rule_check_mapping.remove(check_id_entry)
-            rule_check_mapping.remove(check_description_entry)
-            rule_check_mapping.append(check_id_entry)
-            rule_check_mapping.append(check_description_entry)
+            del check_entries_by_index[check_index]
+            check_index = index
+            check_entries_by_index[check_index] = check_entries
+
+    rule_check_mapping: List[Dict[str, str]] = list()
+    for index, prop in enumerate(transformed_list):
+        rule_check_mapping.append(prop)
+        rule_check_mapping.extend(check_entries_by_index.get(index, ()))
     return rule_check_mapping
 
 
 def add_prop(name: str, value: str, remarks: Optional[str] = None) -> Property:
     """Add a property to a set of rule properties."""
-    prop = generate_sample_model(Property)
-    prop.name = name
-    prop.value = value
-    if remarks:
-        prop.remarks = remarks
-    prop.ns = TRESTLE_CD_NS  # type: ignore
-    return prop
+    # Every field is known up front, so the model is built directly rather
+    # than from a generated sample that is then validated field by field.
+    return Property(name=name, value=value, ns=TRESTLE_CD_NS, remarks=remarks or None)
 
 
 def get_benchmark_root(root: str, product: str) -> str:
     """Get the benchmark root."""
-    product_yml_path = product_yaml_path(root, product)
-    product_yaml = load_product_yaml(product_yml_path)
+    product_yaml = get_product_yaml(root, product)
     product_dir = product_yaml.get("product_dir")
     benchmark_root = os.path.join(product_dir, product_yaml.get("benchmark_root"))
     return benchmark_root
 
 
-def get_profile_params(root: str, product: str, profile_id: str) -> Dict[str, Any]:
-    profiles = get_profiles_from_products(root, [product], sorted=True)
-    params = {}
-    for profile in profiles:
-        if profile.profile_id == profile_id:
-            params = get_variables_from_profiles([profile])
-            break
-    return params
+def get_profile_params(profiles: Dict[str, Any], profile_id: str) -> Dict[str, Any]:
+    """Get the parameters of a profile from the product profiles."""
+    profile = profiles.get(profile_id)
+    if profile is None:
+        return {}
+    return get_variables_from_profiles([profile])
 
 
 class ParamInfo:
@@ -213,6 +245,11 @@ class RulesTransformer:
         self.root = root
         self.product = product
 
+        # Every rule yaml is expanded with the product data, so the product
+        # is loaded once rather than for each rule. Expanding macros adds them
+        # to the substitutions, so the shared product yaml is copied.
+        product_yaml = get_product_yaml(root, self.product)
+        self._substitutions: Dict[str, Any] = dict(product_yaml._data_as_dict)
         benchmark_root = get_benchmark_root(root, self.product)
         self.rules_dirs_for_product: Dict[str, str] = dict()
         for dir_path in find_rule_dirs_in_paths([benchmark_root]):
@@ -220,22 +257,32 @@ class RulesTransformer:
             self.rules_dirs_for_product[rule_id] = dir_path
 
         self._rules_by_id: Dict[str, RuleInfo] = dict()
+        # Profile parameters are the same for every rule, so each one is
+        # looked up once and shared between rules.
+        self._params_by_id: Dict[str, ParamInfo] = dict()
+        self._rule_id_props: Dict[str, Property] = dict()
         self.profile_id = os.path.basename(profile).split(".profile")[0]
-        self.profile_params = get_profile_params(root, product, self.profile_id)
+        # The product profiles are loaded once per transformer
+        self.profiles_by_id: Dict[str, Any] = get_product_profiles(root, product)
+        self.profile_params = get_profile_params(self.profiles_by_id, self.profile_id)
 
     def _new_param_obj(self, param_id: str) -> ParamInfo:
         param_description = get_variable_property(self.root, param_id, "description")
-        param_obj = ParamInfo(param_id, param_description)
+        # Normalized the same way as rule descriptions
+        param_obj = ParamInfo(param_id, param_description.replace("\n", " ").strip())
         return param_obj
 
     def _get_params(self, root: str, rule_obj: RuleInfo) -> None:
         # Here need to add params only in this rule.
         for param_id, param_data in self.profile_params.items():
-            param_obj = self._new_param_obj(param_id)
-            selected_value = param_data[self.product][self.profile_id]
-            param_obj.set_selected_value(selected_value)
-            options = get_variable_options(root, param_id)
-            param_obj.set_options(options)
+            param_obj = self._params_by_id.get(param_id)
+            if param_obj is None:
+                param_obj = self._new_param_obj(param_id)
+                selected_value = param_data[self.product][self.profile_id]
+                param_obj.set_selected_value(selected_value)
+                options = get_variable_options(root, param_id)
+                param_obj.set_options(options)
+                self._params_by_id[param_id] = param_obj
             rule_obj.add_parameter(param_obj)
 
     def add_rules(self, rules: List[str]) -> None:
@@ -293,11 +340,9 @@ class RulesTransformer:
         Args:
             rule_obj: The rule object where collection rule data is stored.
         """
-        product_yml_path = product_yaml_path(self.root, self.product)
-        product_yaml = load_product_yaml(product_yml_path)
         rule_file = get_rule_dir_yaml(rule_obj.rule_dir)
         rule_yaml = open_and_macro_expand_from_dir(
-            rule_file, self.root, substitutions_dict=product_yaml._data_as_dict
+            rule_file, self.root, substitutions_dict=self._substitutions
         )
 
         rule_obj.add_description(rule_yaml["title"].replace("\n", " ").strip())
@@ -308,9 +353,7 @@ class RulesTransformer:
         """Get a set of parameter properties for a rule object."""
         id_prop = add_prop(PARAMETER_ID, param_info.id, ruleset)
         description_prop = add_prop(
-            PARAMETER_DESCRIPTION,
-            param_info.description.replace("\n", " ").strip(),
-            ruleset,
+            PARAMETER_DESCRIPTION, param_info.description, ruleset
         )
         alternative_prop = add_prop(
             PARAMETER_VALUE_ALTERNATIVES,
@@ -333,8 +376,18 @@ class RulesTransformer:
         return rule_properties
 
     def get_rule_id_props(self, rule_ids: List[str]) -> List[Property]:
-        """Get the rule props with rule ids."""
-        props: List[Property] = [add_prop(RULE_ID, rule_id) for rule_id in rule_ids]
+        """
+        Get the rule props with rule ids.
+
+        Notes: The props are shared between calls and must not be modified.
+        """
+        props: List[Property] = list()
+        for rule_id in rule_ids:
+            prop = self._rule_id_props.get(rule_id)
+            if prop is None:
+                prop = add_prop(RULE_ID, rule_id)
+                self._rule_id_props[rule_id] = prop
+            props.append(prop)
         return props
 
     def get_all_rule_objs(self) -> Dict[str, RuleInfo]:
@@ -8,7 +8,7 @@ import csv
 import json
 import logging
 import pathlib
-from typing import Dict, List, Optional
+from typing import Dict, FrozenSet, List, Optional
 
 import trestle.tasks.csv_to_oscal_cd as csv_to_oscal_cd
 from trestle.common.const import TRESTLE_GENERIC_NS
@@ -208,6 +208,10 @@ class CSVBuilder:
         self._fieldnames.append(PARAMETER_DESCRIPTION)
         self._fieldnames.append(PARAMETER_VALUE_ALTERNATIVES)
         self._fieldnames.append(PARAMETER_VALUE_DEFAULT)
+        # Every row is checked against the columns, so they are looked up once
+        # and the allowed names are kept as a set.
+        self._required_names: List[str] = self._csv_columns.get_required_column_names()
+        self._allowed_names: FrozenSet[str] = frozenset(self._fieldnames)
 
     @property
     def row_count(self) -> int:
@@ -223,12 +227,12 @@ class CSVBuilder:
     def validate_row(self, row: Dict[str, str]) -> None:
         """Validate a row."""
         # Check that the row has all the required keys
-        for key in self._csv_columns.get_required_column_names():
+        for key in self._required_names:
             if key not in row:
                 raise RuntimeError(f"Row missing key: {key}")
         # Check that the row has no extra keys
         for key in row.keys():
-            if key not in self._fieldnames:
+            if key not in self._allowed_names:
                 raise RuntimeError(f"Row has extra key: {key}")
 
     def write_to_file(self, filepath: pathlib.Path) -> None:
@@ -243,5 +247,4 @@ class CSVBuilder:
             writer = csv.DictWriter(csv_file, fieldnames=self._fieldnames)
             writer.writeheader()
             writer.writerow(example_row)
-            for row in self._rows:
-                writer.writerow(row)
+            writer.writerows(self._rows)
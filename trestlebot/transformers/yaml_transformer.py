@@ -6,7 +6,7 @@
 import logging
 import pathlib
 from io import StringIO
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from pydantic import ValidationError
 from ruamel.yaml import YAML
@@ -36,13 +36,15 @@ class ToRulesYAMLTransformer(ToRulesTransformer):
     def __init__(self) -> None:
         """Initialize."""
         super().__init__()
+        # The loader is reused across rules. Like the transformer, it is not
+        # meant to be shared between threads.
+        self._yaml = YAML(typ="safe")
 
-    def transform(self, blob: str) -> TrestleRule:
-        """Transform YAML data into a TrestleRule object."""
+    def transform(self, blob: Union[str, bytes]) -> TrestleRule:
+        """Transform YAML text or undecoded YAML bytes into a TrestleRule object."""
         validation_errors: List[ValidationError] = []
         try:
-            yaml = YAML(typ="safe")
-            yaml_data: Dict[str, Any] = yaml.load(blob)
+            yaml_data: Dict[str, Any] = self._yaml.load(blob)
 
             rule_info_data = yaml_data[const.RULE_INFO_TAG]
 
@@ -100,6 +102,14 @@ class FromRulesYAMLTransformer(FromRulesTransformer):
     Interface for YAML transformer from Rules model.
     """
 
+    def __init__(self) -> None:
+        """Initialize."""
+        super().__init__()
+        # The dumper is reused across rules, the same as the loader in
+        # ToRulesYAMLTransformer.
+        self._yaml = YAML(typ="safe")
+        self._yaml.default_flow_style = False
+
     def transform(self, rule: TrestleRule) -> str:
         """
         Transform TrestleRule object into YAML data.
@@ -113,10 +123,8 @@ class FromRulesYAMLTransformer(FromRulesTransformer):
         """
 
         rule_info: Dict[str, Any] = self._to_rule_info(rule)
-        yaml_obj = YAML(typ="safe")
-        yaml_obj.default_flow_style = False
         yaml_stream = StringIO()
-        yaml_obj.dump(rule_info, yaml_stream)
+        self._yaml.dump(rule_info, yaml_stream)
         yaml_str = yaml_stream.getvalue()
         yaml_stream.close()
 
@@ -125,9 +133,7 @@ class FromRulesYAMLTransformer(FromRulesTransformer):
     def write_to_file(self, rule: TrestleRule, file_path: pathlib.Path) -> None:
         """Write TrestleRule object to YAML file."""
         rule_info: Dict[str, Any] = self._to_rule_info(rule)
-        yaml_obj = YAML(typ="safe")
-        yaml_obj.default_flow_style = False
-        yaml_obj.dump(rule_info, file_path)
+        self._yaml.dump(rule_info, file_path)
 
     @staticmethod
     def _to_rule_info(rule: TrestleRule) -> Dict[str, Any]: